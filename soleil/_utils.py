@@ -65,8 +65,12 @@ def get_all_annotations(cls) -> Dict[str, Any]:
     )
 
 
+_INVALID_FILENAME_CHARS = str.maketrans({"/": "|", "\\": "|", ":": "|"})
+
+
 def as_valid_filename(in_str) -> str:
-    return in_str.replace("/", "|").replace("\\", "|").replace(":", "|")
+    # A single translate pass rather than one str.replace pass per invalid character
+    return in_str.translate(_INVALID_FILENAME_CHARS)
 
 
 def abs_mod_name(abs_module_name: str, rel_name: str):
@@ -82,6 +86,13 @@ def abs_mod_name(abs_module_name: str, rel_name: str):
     if not abs_module_name or abs_module_name[0] == ".":
         raise ValueError(f"abs_module_name={abs_module_name}")
 
+    if not rel_name:
+        raise ValueError("Empty module reference")
+
+    if rel_name[0] != "." and rel_name[-1] != "." and ".." not in rel_name:
+        # Already absolute and without dot sequences to resolve
+        return rel_name
+
     if rel_name[0] == ".":
         concated = abs_module_name + rel_name
     else:
@@ -6,7 +6,6 @@ from typing import List, Optional, Union
 from uuid import uuid4
 from soleil.loader.loader import load_solconf
 from soleil.resolvers.base import resolve
-import re
 
 from soleil.resolvers.module_resolver import SolConfModule
 
@@ -234,11 +233,10 @@ class SolConfArg:
         if (
             overrides
             and isinstance(overrides[0], str)
-            and (root_clobber := re.match(r"^\*\*\=(?P<path>.*$)", overrides[0]))
+            and overrides[0].startswith("**=")
         ):
             # Check for source clobber
-            overrides.pop(0)
-            config_source = root_clobber["path"]
+            config_source = overrides.pop(0)[len("**=") :]
         elif self._config_source is None:
             # If config file not previously defined, get from overrides
             config_source = overrides.pop(0)
@@ -1,10 +1,12 @@
 from pathlib import Path
-from typing import Dict, Optional, List, Union
+from types import CodeType
+from typing import Dict, Optional, List, Tuple, Union
 import ast
+import hashlib
 from uuid import uuid4
 from soleil._utils import PathSpec, Unassigned
 
-from soleil.overrides.overrides import OverrideSpec, eval_overrides
+from soleil.overrides.overrides import OverrideSpec, PreCompOverride, eval_overrides
 from soleil.overrides.variable_path import VarPath
 from . import pre_processor
 
@@ -40,7 +42,7 @@ def load_solconf(
     """
 
     # Check path is a *.solconf file
-    conf_path = Path(conf_path)
+    conf_path = conf_path if isinstance(conf_path, Path) else Path(conf_path)
     if conf_path.suffix != DEFAULT_EXTENSION or not conf_path.is_file():
         raise ValueError(f"Expected a `*.solconf` file but received `{conf_path}`")
 
@@ -74,12 +76,18 @@ class ConfigLoader:
     """ Contains previously-loaded modules or package paths """
     package_roots: Dict[str, Path]
     """ Contains the roots of solconf pacakges """
+    package_overrides_by_target: Dict[str, Dict[str, PreCompOverride]]
+    """ Maps each package's override target strings to overrides, for constant-time override lookups """
+    compiled_files: Dict[Path, Tuple[bytes, CodeType, Optional[str], Tuple[str, ...]]]
+    """ Pre-processed and compiled solconf files, along with the digest of the file contents they were compiled from """
 
     def __init__(self):
         """See the documentation for :func:`load_solconf`."""
         self.modules = {}
         self.package_roots = {}
         self.package_overrides = {}
+        self.package_overrides_by_target = {}
+        self.compiled_files = {}
 
     def init_package(
         self,
@@ -95,8 +103,16 @@ class ConfigLoader:
             raise ValueError(
                 f"Attempted to reinitialize existings solconf package `{name}`"
             )
-        self.package_roots[name] = Path(path).resolve(strict=True)
-        self.package_overrides[name] = eval_overrides(overrides or [], {}, {})
+        self.package_roots[name] = (
+            path if isinstance(path, Path) else Path(path)
+        ).resolve(strict=True)
+        self.package_overrides[name] = (
+            eval_overrides(overrides, {}, {}) if overrides else []
+        )
+        # Target strings are unique -- this is checked by eval_overrides
+        self.package_overrides_by_target[name] = {
+            _ovr.target.as_str(): _ovr for _ovr in self.package_overrides[name]
+        }
         return name
 
     def get_sub_module_path(self, abs_module_name, check_exists=True) -> Path:
@@ -114,12 +130,16 @@ class ConfigLoader:
 
         # Check that the module path exists
         if check_exists and not module_path.is_file():
-            raise ValueError(
-                f"No solconf module  `{abs_module_name}` (module path `{module_path.absolute()})`."
-            )
+            raise self._missing_module_error(abs_module_name, module_path)
 
         return module_path
 
+    @staticmethod
+    def _missing_module_error(abs_module_name: str, module_path: Path) -> ValueError:
+        return ValueError(
+            f"No solconf module  `{abs_module_name}` (module path `{module_path.absolute()})`."
+        )
+
     def load(
         self,
         abs_module_name: str,
@@ -172,43 +192,75 @@ class ConfigLoader:
         root_config: Optional[SolConfModule],
         reqs: Optional[List[OverrideSpec]] = None,
     ):
-        #
-        module_path = self.get_sub_module_path(abs_module_name)
+        # The file is only checked for if it cannot be read, saving a stat call on every load
+        module_path = self.get_sub_module_path(abs_module_name, check_exists=False)
+        try:
+            code, promoted_name, imported_names = self._compile_solconf_file(
+                module_path
+            )
+        except OSError:
+            if not module_path.is_file():
+                # Raises the standard error, without chaining the OSError, if the module does not exist
+                raise self._missing_module_error(abs_module_name, module_path) from None
+            raise
 
         # Instantiate the solconf module
         module = SolConfModule(
             abs_module_name,
             module_path,
             var_path,
-            eval_overrides(reqs or [], {}, {}),
+            # Most modules are loaded without reqs
+            eval_overrides(reqs, {}, {}) if reqs else [],
             root_config,
         )
 
+        # Set the pre-processed and compiled code
+        module.__soleil_pp_meta__["code"] = code
+        module.__soleil_pp_meta__["executed"] = False
+        module.__soleil_pp_meta__["promoted"] = promoted_name
+
+        # Append the imported ignores
+        module.__soleil_default_hidden_members__.update(imported_names)
+
+        return module
+
+    def _compile_solconf_file(
+        self, module_path: Path
+    ) -> Tuple[CodeType, Optional[str], Tuple[str, ...]]:
+        """
+        Returns the compiled code, promoted member name and imported names of the specified solconf file.
+
+        The same files are loaded again in every new package (e.g., by every call to :func:`load_solconf`
+        or :func:`~soleil.utils.spawn`), so the results are cached until the file's contents change.
+        """
+        # Keyed by contents rather than modification time, which can miss quick successive edits
+        source = module_path.read_bytes()
+        digest = hashlib.sha1(source).digest()
+        cached = self.compiled_files.get(module_path)
+        if cached is not None and cached[0] == digest:
+            return cached[1:]
+
         # Parse the code in the module
-        with open(module.__file__, "rt") as fo:
-            code = fo.read()
-        tree = ast.parse(code)
+        tree = ast.parse(source)
 
         # Apply the pre-processor
         spp = pre_processor.SoleilPreProcessor(module_path)
         tree = spp.visit(tree)
-        module.__soleil_pp_meta__["tree"] = tree
-        module.__soleil_pp_meta__["executed"] = False
-        module.__soleil_pp_meta__["promoted"] = spp.promoted_name
 
-        # Append the imported ignores
-        module.__soleil_default_hidden_members__.update(spp.imported_names)
+        # Keep only the compiled code -- the syntax tree is not needed after compilation
+        out = (
+            compile(tree, filename=str(module_path), mode="exec"),
+            spp.promoted_name,
+            tuple(spp.imported_names),
+        )
+        self.compiled_files[module_path] = (digest, *out)
 
-        return module
+        return out
 
     def _execute_solconf_module(self, module):
         # Execute the module
         exec(
-            compile(
-                module.__soleil_pp_meta__["tree"],
-                filename=str(module.__file__),
-                mode="exec",
-            ),
+            module.__soleil_pp_meta__["code"],
             _globals := vars(module),
             _globals,
         )
@@ -4,7 +4,7 @@ import ast
 from pathlib import Path
 from typing import Any, List, Tuple, Type, Union
 
-__soleil_keywords__ = ["_soleil_override", "load", "promoted", "noid"]
+__soleil_keywords__ = frozenset({"_soleil_override", "load", "promoted", "noid"})
 
 
 class RaisesError(ast.NodeVisitor):
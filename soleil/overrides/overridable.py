@@ -12,6 +12,8 @@ class Overridable(abc.ABC):
     (see :func:`_soleil_override`).
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def set(self, new_value):
         ...
@@ -26,7 +28,9 @@ class Overridable(abc.ABC):
 
 
 class submodule(Overridable):
-    module_name: Optional[str] = None
+    __slots__ = ("module_name", "sub_module_name", "containing_module", "reqs")
+
+    module_name: Optional[str]
     sub_module_name: str
     containing_module: str
 
@@ -55,6 +59,7 @@ class submodule(Overridable):
         self.containing_module = infer_solconf_module()
 
         if len(args) == 1:
+            self.module_name = None
             self.sub_module_name = args[0]
         elif len(args) == 2:
             self.module_name, self.sub_module_name = args
@@ -107,6 +112,8 @@ class choices(Overridable):
 
     """
 
+    __slots__ = ("values", "choice")
+
     def __init__(self, values: Dict[str, Any], default):
         self.values = dict(values)
         self.choice = default
@@ -1,12 +1,6 @@
 from collections import Counter
 from typing import Any, Dict, List, Optional, Union
-from jztools.validation import NoItem, checked_get_single
-from soleil._utils import (
-    infer_solconf_package,
-    Unassigned,
-    get_caller_frame,
-    get_global_loader,
-)
+from soleil._utils import Unassigned, get_caller_frame, get_global_loader
 from .overridable import Overridable
 from .variable_path import deduce_soleil_var_path, CompoundRefStr
 from .parser import Override, OverrideType, parse_overrides, parse_ref
@@ -65,16 +59,17 @@ def cast_overrides(overrides: List[OverrideSpec]) -> List[Override]:
     """
     # Map dicts and strings to Override objects
     _overrides = []
+    append, extend = _overrides.append, _overrides.extend
     for _ovr in overrides:
         if isinstance(_ovr, Override):
-            _overrides.append(_ovr)
+            append(_ovr)
         elif isinstance(_ovr, str):
-            _overrides.extend(parse_overrides(_ovr))
+            extend(parse_overrides(_ovr))
         elif isinstance(_ovr, dict):
-            for key, val in _ovr.items():
-                _overrides.append(
-                    PreCompOverride(parse_ref(key), OverrideType.existing, val)
-                )
+            extend(
+                PreCompOverride(parse_ref(key), OverrideType.existing, val)
+                for key, val in _ovr.items()
+            )
         else:
             raise TypeError(f"Invalid type {type(_ovr)} for override specification")
 
@@ -136,23 +131,19 @@ def _soleil_override(target_name: str, value: Any):
     """
 
     frame = get_caller_frame()
-    target_var_path = deduce_soleil_var_path(target_name, frame=frame)
-    overrides = get_global_loader().package_overrides[infer_solconf_package()]
+    # The calling frame's globals are the members of the solconf module making the assignment
+    overrides_by_target = get_global_loader().package_overrides_by_target[
+        frame.f_globals["__package__"]
+    ]
 
     ovr_value = Unassigned
     if (
-        target_var_path
+        # Skip deducing the variable path when the package has no overrides
+        overrides_by_target
+        and (target_var_path := deduce_soleil_var_path(target_name, frame=frame))
         is not None  # Is None if target is inaccesible due to a promotion
-        and (
-            _ovr := checked_get_single(
-                filter(
-                    lambda x: x.target == target_var_path,
-                    get_global_loader().package_overrides[infer_solconf_package()],
-                ),
-                raise_empty=False,
-            )
-        )
-        is not NoItem
+        and (_ovr := overrides_by_target.get(target_var_path.as_str())) is not None
+        and _ovr.target == target_var_path
     ):
         # Get the override value
         _ovr.used += 1
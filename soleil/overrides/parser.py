@@ -1,10 +1,13 @@
 import ast
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, List, Optional, Tuple, Type
+from functools import lru_cache
+from types import CodeType
+from keyword import iskeyword
+from typing import Any, List, Optional, Tuple, Type, Union
 from jztools.py import strict_zip
 from soleil._utils import Unassigned
-from .variable_path import VarPath, Attribute, Subscript
+from .variable_path import VarPath, Attribute, Ref, Subscript
 
 
 class OverrideType(Enum):
@@ -25,14 +28,18 @@ class Override:
     """ The source code corresponding to this override, if available"""
     used: int = 0
     """ The number of times the override has been used -- can be used multiple times when overrides are shared by a spawned parent class and its child class """
+    _code: Optional[CodeType] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ The compiled value expression, computed on the first call to :meth:`get_value` """
 
     def get_value(self, _globals=None, _locals=None):
         """
         Extracts the assignment value from the specified globals and locals.
         """
-        return eval(
-            compile(self.value_expr, filename="<none>", mode="eval"), _globals, _locals
-        )
+        if self._code is None:
+            self._code = compile(self.value_expr, filename="<none>", mode="eval")
+        return eval(self._code, _globals, _locals)
 
 
 class _RestrictedNodeVisitor(ast.NodeVisitor):
@@ -44,6 +51,8 @@ class _RestrictedNodeVisitor(ast.NodeVisitor):
     """ Will call ``ast.NodeVisitor.generic_visit`` on these nodes """
     specialized_nodes: Tuple[Type[ast.AST], ...]
     """ A specialized method is implemented for these nodes """
+    permitted_nodes: Tuple[Type[ast.AST], ...] = default_nodes
+    """ All the default and specialized nodes -- computed once per class, as it is checked for every visited node """
 
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "specialized_nodes"):
@@ -53,13 +62,10 @@ class _RestrictedNodeVisitor(ast.NodeVisitor):
                     for name in (_ for _ in vars(cls) if _.startswith("visit_"))
                 ]
             )
+        cls.permitted_nodes = (*cls.default_nodes, *cls.specialized_nodes)
 
         return super().__init_subclass__()
 
-    @property
-    def permitted_nodes(self):
-        return (*self.default_nodes, *(getattr(self, "specialized_nodes", tuple())))
-
     def generic_visit(self, node):
         if isinstance(node, self.permitted_nodes):
             super().generic_visit(node)
@@ -163,10 +169,23 @@ class OverrideSplitter(_RestrictedNodeVisitor):
         return node
 
 
-def parse_ref(ref: str):
+def parse_ref(ref: str) -> VarPath:
     """
     Takes a reference such as ``'a.b[0].x`` and parses it into a sequence of attribute or item references.
     """
+    if not ref:
+        # E.g., the qualified name at the module level
+        return VarPath()
+    # A new VarPath is returned on each call, as callers might modify it.
+    return VarPath(_parse_ref(ref))
+
+
+@lru_cache(maxsize=4096)
+def _parse_ref(ref: str) -> Tuple[Ref, ...]:
+    # Memoized, as the same references (e.g., class qualified names) are parsed on every solconf assignment.
+
+    if (refs := _scan_ref(ref)) is not None:
+        return refs
 
     try:
         tree = ast.parse(ref)
@@ -177,7 +196,35 @@ def parse_ref(ref: str):
     except Exception as err:
         raise SyntaxError(f"Error parsing ref string `{ref}`") from err
 
-    return ref_exctr.refs
+    return tuple(ref_exctr.refs)
+
+
+def _scan_ref(ref: str) -> Optional[Tuple[Ref, ...]]:
+    """
+    Tokenizes and validates references made of names and integer subscripts (e.g., ``'a.b[0].c'``) in a single pass,
+    without building a syntax tree. Returns ``None`` for any other reference, which must then be parsed with :func:`ast.parse`.
+    """
+    # Non-ASCII names go through ast.parse, which applies NFKC normalization to identifiers.
+    if not ref.isascii():
+        return None
+
+    out = []
+    for part in ref.split("."):
+        name, *subscripts = part.split("[")
+        if not name.isidentifier() or iskeyword(name):
+            return None
+        out.append(Attribute(name))
+        for _subscript in subscripts:
+            index = _subscript[:-1]
+            if (
+                _subscript[-1:] != "]"
+                or not index.isdecimal()
+                or (index[0] == "0" and len(index) > 1)
+            ):
+                return None
+            out.append(Subscript(int(index)))
+
+    return tuple(out)
 
 
 def parse_overrides(overrides: str) -> List[Override]:
@@ -193,7 +240,8 @@ def parse_overrides(overrides: str) -> List[Override]:
 
         # Append source expression
         # TODO: use ast.get_source_segment in the code below
-        sources = [extract_string_expression(overrides, _expr) for _expr in tree.body]
+        lines = overrides.split("\n")  # Split once for all the overrides
+        sources = [extract_string_expression(lines, _expr) for _expr in tree.body]
         split_overrides = splitter.overrides
         for _ovr, _src in strict_zip(split_overrides, sources):
             _ovr.source = _src
@@ -203,11 +251,12 @@ def parse_overrides(overrides: str) -> List[Override]:
     return split_overrides
 
 
-def extract_string_expression(source: str, expr: ast.Expr):
+def extract_string_expression(source: Union[str, List[str]], expr: ast.Expr):
     # Extracts the string containing the override from a possibly multi-override string (e.g., a multi-line string or semi-colon separated string).
+    # The source can also be provided already split into lines.
     if expr.lineno != expr.end_lineno:
         raise NotImplementedError(
             "Currently, only single-line expressions within multi-line overrides are supported"
         )
-    lines = source.split("\n")
+    lines = source.split("\n") if isinstance(source, str) else source
     return lines[expr.lineno - 1][expr.col_offset : expr.end_col_offset]
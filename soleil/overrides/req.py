@@ -1,7 +1,7 @@
 from jztools.validation import NoItem, checked_get_single
 from soleil.overrides.overrides import deduce_soleil_var_path
 from soleil.resolvers.base import Resolver
-from soleil._utils import Unassigned, infer_solconf_module, get_global_loader
+from soleil._utils import Unassigned
 from soleil.overrides.overridable import Overridable
 
 
@@ -22,15 +22,15 @@ class req(Overridable):
         self._value = value
 
     def get(self, target, frame):
-        solconf_module = get_global_loader().modules[infer_solconf_module()]
-        var_path = deduce_soleil_var_path(target, frame, relative=True)
-
         if not self.missing:
             return self._value
-        elif (
+
+        # The frame's globals are the members of the containing solconf module
+        var_path = deduce_soleil_var_path(target, frame, relative=True)
+        if (
             ovr := checked_get_single(
                 filter(
-                    lambda _x: _x.target == var_path, solconf_module.__soleil_reqs__
+                    lambda _x: _x.target == var_path, frame.f_globals["__soleil_reqs__"]
                 ),
                 raise_empty=False,
             )
@@ -45,6 +45,7 @@ class reqResolver(Resolver):
     """Resolver for ``req`` instances"""
 
     resolvable: req
+    type_dispatched = True
 
     @classmethod
     def can_handle(cls, value):
@@ -19,6 +19,8 @@ A reference string such as ``'a[0].b.c[0]'`` that can be converted to a :class:`
 
 
 class Ref(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def get(self, obj):
         ...
@@ -30,6 +32,7 @@ class Ref(abc.ABC):
 
 @dataclass
 class Attribute(Ref):
+    __slots__ = ("name",)
     name: str
 
     def get(self, obj):
@@ -141,17 +144,15 @@ class VarPath(UserList):
         return parse_ref(value)
 
     def as_str(self):
-        out = ""
+        # Join the parts once instead of re-building the string for every ref
+        parts = []
         for _ref in self:
             if isinstance(_ref, Attribute):
-                if out:
-                    out += f".{_ref.name}"
-                else:
-                    out = _ref.name
+                parts.append(f".{_ref.name}" if parts else _ref.name)
             elif isinstance(_ref, Subscript):
-                out += f"[{_ref.value}]"
+                parts.append(f"[{_ref.value}]")
 
-        return out
+        return "".join(parts)
 
 
 def deduce_soleil_var_path(
@@ -186,12 +187,9 @@ def deduce_soleil_var_path(
 
     # The variable path of the module
     module_var_path = frame.f_globals["__soleil_var_path__"]
-    # The name of the promoted variable as a variable path
+    # The name of the promoted variable as a variable path -- the frame globals are the containing module's members
     promoted_rel_var_path = VarPath.from_str(
-        get_global_loader()
-        .modules[frame.f_globals["__name__"]]
-        .__soleil_pp_meta__["promoted"]
-        or ""
+        frame.f_globals["__soleil_pp_meta__"]["promoted"] or ""
     )
     # The (nested) path to the (nested) variable relative to the containing module
     class_rel_var_path = VarPath.from_str(frame.f_locals.get("__qualname__", ""))
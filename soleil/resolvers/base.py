@@ -1,10 +1,13 @@
 import abc
-from typing import Dict, Any, List, Set, Type
+import inspect
+from typing import Dict, Any, List, Optional, Set, Type
 from numbers import Number
 from jztools.py import entity_name
 from .modifiers import Modifiers
 
 __registered_resolvers__: Set[Type["Resolver"]] = set()
+_resolvers_by_type: Dict[Type, Optional[Type["Resolver"]]] = {}
+""" Caches the :func:`get_resolver` look-ups of resolvables handled by type-dispatched resolvers. """
 
 
 class ResolutionError(Exception):
@@ -18,17 +21,32 @@ class _UNRESOLVED:
     pass
 
 
+_LITERAL_TYPES = frozenset({bool, int, float, complex, str, bytes, type(None)})
+""" Exact types that :class:`FirstResolver` resolves to themselves, classified before any resolver look-up. """
+
+
 class Resolver(abc.ABC):
     resolvable: Any
     members: Dict[str, Any]
     modifiers: Dict[str, Any]
 
+    type_dispatched: bool = False
+    """
+    Whether :meth:`can_handle` gives the same answer for all resolvables of the same type (except for resolvables that are themselves types),
+    letting :func:`get_resolver` cache the resolver by type.
+    """
+
     def __init__(self, resolvable):
         self.resolvable = resolvable
 
     def __init_subclass__(cls, register=True):
+        # Sub-classes can override can_handle, so the flag is only trusted when declared by the class itself
+        if "type_dispatched" not in vars(cls):
+            cls.type_dispatched = False
         if register:
             __registered_resolvers__.add(cls)
+            # The cached look-ups might no longer be valid
+            _resolvers_by_type.clear()
 
     @classmethod
     @abc.abstractmethod
@@ -58,11 +76,18 @@ class Resolver(abc.ABC):
 class TypeResolver(Resolver, register=False):
     """A resolver for any instance of a specific type"""
 
+    type_dispatched = True
+
     handled_type: Type
     """ The type that this resolver handles """
 
     def __init_subclass__(cls, handled_type: Type):
         cls.handled_type = handled_type
+        if "type_dispatched" not in vars(cls):
+            # Sub-classes that keep the isinstance check dispatch by type
+            cls.type_dispatched = (
+                cls.can_handle.__func__ is TypeResolver.can_handle.__func__
+            )
         super().__init_subclass__()
 
     @classmethod
@@ -70,12 +95,14 @@ class TypeResolver(Resolver, register=False):
         return isinstance(resolvable, cls.handled_type)
 
 
-class NonCachedResolver(Resolver):
+class NonCachedResolver(Resolver, register=False):
     def resolve(self):
         return self.compute_resolved()
 
 
 class FirstResolver(NonCachedResolver):
+    type_dispatched = True
+
     @classmethod
     def can_handle(cls, resolvable):
         # None
@@ -91,6 +118,7 @@ class FirstResolver(NonCachedResolver):
 
 
 class DictResolver(NonCachedResolver):
+    type_dispatched = True
     # resolved = {}
 
     @classmethod
@@ -109,6 +137,7 @@ class DictResolver(NonCachedResolver):
 
 
 class IterableResolver(NonCachedResolver):
+    type_dispatched = True
     iterable_types = (list, tuple, set)
 
     @classmethod
@@ -126,13 +155,25 @@ def get_resolver(value):
     """
     Checks if the input value can be resolved and returns the resolver or ``None`` otherwise.
     """
+    # Whether types can be handled depends on their annotations (see ClassResolver), so they are never cached
+    cacheable = not isinstance(value, type)
+    if cacheable and (value_type := type(value)) in _resolvers_by_type:
+        Rslvr = _resolvers_by_type[value_type]
+        return None if Rslvr is None else Rslvr(value)
+
     # Registered resolvers
+    out = None
     for Rslvr in __registered_resolvers__:
+        # The look-up can only be cached if all the checked resolvers dispatch by type
+        cacheable = cacheable and Rslvr.type_dispatched
         if Rslvr.can_handle(value):
-            return Rslvr(value)
+            out = Rslvr
+            break
+    if cacheable:
+        _resolvers_by_type[value_type] = out
 
     # raise ValueError(f"No resolver available for {value}.")
-    return None
+    return None if out is None else out(value)
 
 
 def resolve(value):
@@ -141,23 +182,23 @@ def resolve(value):
     """
     __soleil_nested_resolve__ = None  # Marker used to detect nested resolve calls
 
-    if (resolver := get_resolver(value)) is not None:
+    if type(value) in _LITERAL_TYPES:
+        return value
+    elif (resolver := get_resolver(value)) is not None:
         try:
             return resolver.resolve()
         except Exception as err:
-            import inspect
-
-            stack = inspect.stack()
             if isinstance(err, ResolutionError):
                 raise
             else:
-                raise ResolutionError(
-                    [
-                        str(f.frame.f_locals["value"])
-                        for f in stack
-                        if "__soleil_nested_resolve__" in f.frame.f_locals
-                    ]
-                ) from err
+                # Walk the raw frames -- inspect.stack() would also read the source context of every frame
+                values = []
+                frame = inspect.currentframe()
+                while frame is not None:
+                    if "__soleil_nested_resolve__" in frame.f_locals:
+                        values.append(str(frame.f_locals["value"]))
+                    frame = frame.f_back
+                raise ResolutionError(values) from err
     else:
         return value
 
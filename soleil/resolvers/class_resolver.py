@@ -1,12 +1,12 @@
 from collections import UserDict
+from functools import cached_property
 import inspect
-from itertools import chain
 from types import MappingProxyType
 from soleil.overrides.req import req
 from soleil.resolvers.modifiers import Modifiers, from_annotation, merge_modifiers
 from soleil._utils import Unassigned, get_all_annotations
 from .base import Resolver, displayable, resolve
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Collection, Dict, Optional
 from jztools.py import entity_from_name
 
 
@@ -36,6 +36,7 @@ class DisplayableFromClassResolver(UserDict):
 class ClassResolver(Resolver):
     args = tuple()
     type = None
+    type_dispatched = True
     run: Optional[Callable] = None
     """ The callable that :func:`solex` calls on the resolved module by default """
     # See comment for as_run below
@@ -79,6 +80,9 @@ class ClassResolver(Resolver):
     def _get_resolved_modifiers(self) -> Dict[str, Modifiers]:
         # Only returns annotations that are modifiers or tuples, with tuples merged into a modifier
         annotations = self._get_raw_annotations()
+        if not annotations:
+            # Skip resolving when there is nothing to resolve
+            return {}
 
         return {
             key: modifs
@@ -93,18 +97,30 @@ class ClassResolver(Resolver):
             if isinstance(value, req) and req.missing
         }
 
-    def _get_default_hidden_value(self, name: str):
-        return (name.startswith("__") and name.endswith("__")) or (
-            name in getattr(self.resolvable, "__soleil_default_hidden_members__", set())
-        )
+    def _get_default_hidden_members(self) -> Collection[str]:
+        return getattr(self.resolvable, "__soleil_default_hidden_members__", ())
+
+    def _get_default_hidden_value(
+        self, name: str, default_hidden_members: Optional[Collection[str]] = None
+    ):
+        if default_hidden_members is None:
+            default_hidden_members = self._get_default_hidden_members()
+        return (
+            name.startswith("__") and name.endswith("__")
+        ) or name in default_hidden_members
 
     def _get_default_modifier(
-        self, name: str, value: Any = Unassigned, modifier: Optional[Modifiers] = None
+        self,
+        name: str,
+        value: Any = Unassigned,
+        modifier: Optional[Modifiers] = None,
+        default_hidden_members: Optional[Collection[str]] = None,
     ):
-        modifier = (modifier if modifier is not None else Modifiers()).withdefaults(
-            Modifiers(hidden=self._get_default_hidden_value(name))
+        default = Modifiers(
+            hidden=self._get_default_hidden_value(name, default_hidden_members)
         )
-        return modifier
+        # Most members have no explicit modifier -- the default is then used as is.
+        return default if modifier is None else modifier.withdefaults(default)
 
     def _get_members_and_modifiers(self):
         # Returns members and non-members
@@ -115,27 +131,35 @@ class ClassResolver(Resolver):
 
         # Check all explicit modifiers have valid keys.
         for name, modifier in explicit_modifiers.items():
-            if not set(modifier.keys()).issubset(self.valid_modifier_keys):
+            if invalid_keys := modifier.keys() - self.valid_modifier_keys:
                 raise ValueError(
-                    f"Invalid modifier key(s) `{', '.join(modifier.keys())}` for resolvable {self.resolvable}"
+                    f"Invalid modifier key(s) `{', '.join(invalid_keys)}` for resolvable {self.resolvable}"
                 )
 
         # Get implicit modifiers for un-annotated and partially annotated members,
         # including required members with no explicit value
         extended_modifiers = {}  # Includes explicit and implicit
-        for name in set(chain(raw_members.keys(), explicit_modifiers.keys())):
-            extended_modifiers[name] = self._get_default_modifier(
+        default_hidden_members = self._get_default_hidden_members()  # Once for all members
+        get_default_modifier = self._get_default_modifier
+        for name in raw_members.keys() | explicit_modifiers.keys():
+            extended_modifiers[name] = get_default_modifier(
                 name,
                 raw_members.get(name, Unassigned),
-                explicit_modifiers.get(name, Modifiers()),
+                explicit_modifiers.get(name),
+                default_hidden_members,
             )
 
+        # Apply casts only where specified, avoiding an identity call for all other members
+        extended_members = {}
+        for key, value in raw_members.items():
+            if (cast := extended_modifiers[key].get("cast")) is not None:
+                value = cast(value)
+            extended_members[key] = value
+
+        self.raw_members = raw_members
         self.explicit_modifiers = explicit_modifiers
         self.extended_modifiers = extended_modifiers
-        self.extended_members = {
-            key: self.extended_modifiers[key].get("cast", lambda x: x)(raw_members[key])
-            for key in raw_members
-        }
+        self.extended_members = extended_members
 
         # Set the special members
         for special_name, special_flag in self.special_members.items():
@@ -146,27 +170,25 @@ class ClassResolver(Resolver):
 
     def get_special_member(self, flag_name: str):
         # Check validity of provided type and args variables.
-        arg_names = [
+        arg_names = (
             name
             for name, value in self.extended_modifiers.items()
             if value.get(flag_name, False)
-        ]
-        if len(arg_names) > 1:
+        )
+        if (arg_name := next(arg_names, None)) is None:
+            return Unassigned
+        elif (other_arg_name := next(arg_names, None)) is not None:
             raise ValueError(
-                f"Expected a single `{flag_name}` argument but got multiple ({', '.join(arg_names)}) for resolvable `{self.resolvable}`"
+                f"Expected a single `{flag_name}` argument but got multiple ({', '.join([arg_name, other_arg_name, *arg_names])}) for resolvable `{self.resolvable}`"
+            )
+        elif (out := self.extended_members.get(arg_name, Unassigned)) is Unassigned:
+            raise ValueError(
+                f'Annotation with no value provided for explicit special modifier "{flag_name}"'
             )
-        elif len(arg_names) == 1:
-            if (
-                out := self.extended_members.get(arg_names[0], Unassigned)
-            ) is Unassigned:
-                raise ValueError(
-                    f'Annotation with no value provided for explicit special modifier "{flag_name}"'
-                )
-            return out
         else:
-            return Unassigned
+            return out
 
-    @property
+    @cached_property
     def modifiers(self):
         """Non-special, visible modifiers"""
         special_member_flags = tuple(self.special_members.values())
@@ -177,7 +199,7 @@ class ClassResolver(Resolver):
             and not any(value.get(flag, False) for flag in special_member_flags)
         }
 
-    @property
+    @cached_property
     def members(self):
         """Non-special, visible members"""
         return {key: self.extended_members[key] for key in self.modifiers}
@@ -191,16 +213,16 @@ class ClassResolver(Resolver):
 
         # Resolve
         resolved_args = resolve(self.args or tuple())
+        # Members are already visible -- avoid re-computing the modifiers for every member
         resolved_members = {
-            resolve(name): resolve(value)
-            for name, value in self.members.items()
-            if not self.modifiers[name]["hidden"]
+            resolve(name): resolve(value) for name, value in self.members.items()
         }
         return self.type(*resolved_args, **resolved_members)
 
     def displayable(self, _dict_class=DisplayableFromClassResolver):
-        raw_members = self._get_raw_members()
-        expl_modifiers = self._get_resolved_modifiers()
+        # Re-use the members and modifiers computed at initialization
+        raw_members = self.raw_members
+        expl_modifiers = self.explicit_modifiers
 
         return _dict_class(
             [
@@ -164,6 +164,7 @@ class SolConfModule(ModuleType):
 
 class ModuleResolver(ClassResolver):
     resolvable: SolConfModule
+    type_dispatched = True
     valid_modifier_keys = frozenset(
         {*ClassResolver.valid_modifier_keys, "promoted", "resolves"}
     )
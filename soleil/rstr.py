@@ -25,10 +25,19 @@ class RStr:
         return RStr((x, "/", *self._components))
 
     def compute_resolved(self):
-        return "".join(
-            x.compute_resolved() if isinstance(x, RStr) else str(resolve(x))
-            for x in self._components
-        )
+        # Nested RStr objects (e.g., from ``RStr + RStr``) are flattened using an explicit stack instead of recursive calls
+        out = []
+        stack = [iter(self._components)]
+        while stack:
+            for x in stack[-1]:
+                if type(x) is RStr:
+                    stack.append(iter(x._components))
+                    break
+                # RStr sub-classes (e.g., id_str) are resolved too, so that their value is computed only once
+                out.append(str(resolve(x)))
+            else:
+                stack.pop()
+        return "".join(out)
 
     def __str__(self):
         raise SyntaxError(
@@ -1,7 +1,7 @@
+import os
 from pathlib import Path
 from typing import Optional, Type, List
 
-from jztools.rentemp import RenTempDir, RenTempDirExists
 from soleil.loader.loader import GLOBAL_LOADER, UnusedOverrides, load_solconf
 from soleil.overrides.overrides import OverrideSpec, eval_overrides, merge_overrides
 from soleil.rstr import RStr
@@ -77,8 +77,9 @@ class id_str(RStr):
         self.glue = glue
         self.safe = safe
         self.full = full
-        self.package_name = infer_solconf_package()
         self.root_config = infer_root_config()
+        # Modules share the package of their root config -- avoids inferring the calling module twice
+        self.package_name = self.root_config.__package__
         self.with_root_stem = with_root_stem
 
     @property
@@ -106,12 +107,23 @@ class id_str(RStr):
 
 
 def _is_int(string):
-    """Returns True if the string can be converted to an integer, False otherwise."""
+    """Returns True if the string consists of ASCII digits only (such as the names created by :func:`sub_dir`), False otherwise."""
+    # A string check rather than catching int()'s ValueError, which most non-numeric names would raise.
+    # Other Unicode decimal digits are not produced by str(int) and are excluded.
+    return string.isascii() and string.isdecimal()
+
+
+def _max_sub_dir_index(root: Path) -> int:
+    """Returns the largest integer name of the sub-directories of ``root``, or 0 if there are none."""
+    # Directory entries cache their type, so checking for directories needs no extra stat calls
     try:
-        int(string)
-        return True
-    except ValueError:
-        return False
+        with os.scandir(root) as entries:
+            return max(
+                (int(x.name) for x in entries if _is_int(x.name) and x.is_dir()),
+                default=0,
+            )
+    except FileNotFoundError:
+        return 0
 
 
 def sub_dir(root: Path, create=True):
@@ -123,20 +135,17 @@ def sub_dir(root: Path, create=True):
     if create and not root.is_dir():
         root.mkdir(parents=True, exist_ok=True)
 
+    index = _max_sub_dir_index(root) + 1
     while True:
-        new_sub_dir = root / str(
-            max(
-                (int(x.name) for x in root.glob("*") if _is_int(x.name) and x.is_dir()),
-                default=0,
-            )
-            + 1
-        )
+        new_sub_dir = root / str(index)
         if not create:
             break
         try:
-            with RenTempDir(new_sub_dir):
-                pass
-        except RenTempDirExists:
+            # Atomically reserves the name
+            new_sub_dir.mkdir()
+        except FileExistsError:
+            # Taken concurrently -- entries are only ever added, so try the next index rather than re-scanning
+            index += 1
             continue
         break
     return str(new_sub_dir)
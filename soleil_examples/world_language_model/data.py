@@ -23,7 +23,15 @@ class _Paths:
     def get(self, name):
         assert name in self._urls, f"Invalid file name {name}"
         if not (target := self.root / name).exists():
-            urlretrieve(self._urls[target], target)
+            # Download to a temporary file first so that interrupted downloads are never taken for cached files
+            partial = target.with_name(target.name + ".part")
+            try:
+                urlretrieve(self._urls[name], partial)
+            except BaseException:
+                # Also cleans up after a keyboard interrupt
+                partial.unlink(missing_ok=True)
+                raise
+            partial.replace(target)
         return target
 
 
@@ -33,10 +41,11 @@ class Dictionary(object):
         self.idx2word = []
 
     def add_word(self, word):
-        if word not in self.word2idx:
+        # A single dictionary look-up for words that were already added
+        if (idx := self.word2idx.get(word)) is None:
+            idx = self.word2idx[word] = len(self.idx2word)
             self.idx2word.append(word)
-            self.word2idx[word] = len(self.idx2word) - 1
-        return self.word2idx[word]
+        return idx
 
     def __len__(self):
         return len(self.idx2word)
@@ -53,22 +62,19 @@ class Corpus(object):
     def tokenize(self, path):
         """Tokenizes a text file."""
         assert os.path.exists(path)
-        # Add words to the dictionary
+        # Add words to the dictionary and tokenize the file content in a single pass,
+        # building a single tensor at the end
+        add_word = self.dictionary.add_word
+        ids = []
+        # Read and decode the whole file at once rather than line by line
         with open(path, "r", encoding="utf8") as f:
-            for line in f:
-                words = line.split() + ["<eos>"]
-                for word in words:
-                    self.dictionary.add_word(word)
+            lines = f.read().split("\n")
+        if lines[-1] == "":
+            # No line follows the trailing newline
+            lines.pop()
+        for line in lines:
+            for word in line.split():
+                ids.append(add_word(word))
+            ids.append(add_word("<eos>"))
 
-        # Tokenize file content
-        with open(path, "r", encoding="utf8") as f:
-            idss = []
-            for line in f:
-                words = line.split() + ["<eos>"]
-                ids = []
-                for word in words:
-                    ids.append(self.dictionary.word2idx[word])
-                idss.append(torch.tensor(ids).type(torch.int64))
-            ids = torch.cat(idss)
-
-        return ids
+        return torch.tensor(ids, dtype=torch.int64)
@@ -12,3 +12,13 @@ def test_abs_mod_name():
         match=f"Module reference `abc.def...xyz` refers beyond the root package",
     ):
         mdl.abs_mod_name("abc.def", "..xyz")
+
+    # Absolute names with dot sequences are still resolved
+    assert mdl.abs_mod_name("abc.def", "xyz.abc..uvw") == "xyz.uvw"
+
+    with pytest.raises(ValueError, match="Empty module reference"):
+        mdl.abs_mod_name("abc.def", "")
+
+
+def test_as_valid_filename():
+    assert mdl.as_valid_filename("a/b\\c:d=1") == "a|b|c|d=1"
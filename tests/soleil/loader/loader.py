@@ -1,7 +1,9 @@
 import ast
+import pytest
 from soleil.loader import loader as mdl
 from soleil.resolvers.base import resolve
 from tests import TEST_DATA_ROOT
+from tests.helpers import solconf_file
 
 
 class TestConfigLoader:
@@ -25,3 +27,27 @@ class TestConfigLoader:
     def test_load_submodule(self):
         x = self.load("loader/with_submodules/main", resolve=True)
         assert x == "solid_black"
+
+    def test_compiled_file_cache(self):
+        with solconf_file("a = 1") as path:
+            module0 = mdl.load_solconf(path, resolve=False)
+            module1 = mdl.load_solconf(path, resolve=False)
+            assert (
+                module0.__soleil_pp_meta__["code"] is module1.__soleil_pp_meta__["code"]
+            )
+            assert resolve(module1) == {"a": 1}
+
+            # Modified files are re-compiled
+            path.write_text("a = 10\nb = 2")
+            assert mdl.load_solconf(path) == {"a": 10, "b": 2}
+
+            # Including same-size changes made right away
+            path.write_text("a = 20\nb = 3")
+            assert mdl.load_solconf(path) == {"a": 20, "b": 3}
+
+    def test_missing_module(self):
+        with solconf_file("a = load('.missing')") as path:
+            with pytest.raises(ValueError, match="No solconf module") as err:
+                mdl.load_solconf(path)
+            # The failed read is not chained to the error
+            assert err.value.__suppress_context__
@@ -1,4 +1,5 @@
 #
+import pytest
 from soleil.overrides import parser as mdl
 
 S = mdl.Subscript
@@ -8,12 +9,41 @@ A = mdl.Attribute
 class TestRefExtractor:
     def test_all(self):
         for ref, expected in [
+            ("", []),
             ("a", [A("a")]),
             ("a.b[0].c", [A("a"), A("b"), S(0), A("c")]),
             ("a['abc']", [A("a"), S("abc")]),
+            ("a.b.c", [A("a"), A("b"), A("c")]),
+            ("a . b", [A("a"), A("b")]),
+            ("a[10][2].b", [A("a"), S(10), S(2), A("b")]),
+            ("a[0x1]", [A("a"), S(1)]),
         ]:
             assert mdl.parse_ref(ref) == expected
 
+    def test_invalid(self):
+        for ref in [
+            "a.",
+            ".a",
+            "a..b",
+            "a.class",
+            "None",
+            "a.1",
+            "a[",
+            "a[]",
+            "[0]",
+            "a[01]",
+            "a[0]b",
+        ]:
+            with pytest.raises(SyntaxError):
+                mdl.parse_ref(ref)
+
+    def test_memoized(self):
+        ref0 = mdl.parse_ref("a.b[0]")
+        ref1 = mdl.parse_ref("a.b[0]")
+        assert ref0 == ref1 and ref0 is not ref1
+        ref0.append(A("c"))
+        assert mdl.parse_ref("a.b[0]") == [A("a"), A("b"), S(0)]
+
 
 class TestOverrideSplitter:
     ovr_strs = [
@@ -47,3 +77,10 @@ class TestOverrideSplitter:
             assert ovr.assign_type is ovr_type
 
         assert k == len(self.ovr_strs) - 1
+
+    def test_compiled_once(self):
+        ovr = mdl.parse_overrides("a = [1, 2]")[0]
+        assert ovr.get_value() == [1, 2]
+        code = ovr._code
+        assert ovr.get_value() == [1, 2]
+        assert ovr._code is code
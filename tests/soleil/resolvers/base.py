@@ -1,8 +1,46 @@
-from soleil import resolve
+import pytest
+from soleil import resolve, load_solconf
+from soleil.resolvers.base import IterableResolver, ResolutionError, get_resolver
+from soleil.resolvers.class_resolver import ClassResolver, as_type
 from tests import load_test_data
+from tests.helpers import solconf_file
 
 
 class TestBaseResolvers:
     def test_all(self):
         loaded = load_test_data("base_resolvers")
         resolve(loaded)
+
+    def test_resolution_error(self):
+        with solconf_file(
+            "class A:\n    type: as_type = lambda: 1 / 0\nb = [A]"
+        ) as path:
+            with pytest.raises(
+                ResolutionError, match=r"nested resolution: `<class '.*\.main\.A'>`"
+            ) as err:
+                load_solconf(path)
+            assert isinstance(err.value.__cause__, ZeroDivisionError)
+
+    def test_resolvers_by_type(self):
+        assert isinstance(get_resolver([1, 2]), IterableResolver)
+        assert isinstance(get_resolver([3]), IterableResolver)
+
+        # Types still go through ClassResolver's annotation check
+        class A:
+            type: as_type = dict
+
+        class B:
+            type = dict
+
+        assert isinstance(get_resolver(A), ClassResolver)
+        assert get_resolver(B) is None
+        assert isinstance(get_resolver(A), ClassResolver)
+
+    def test_type_dispatched_not_inherited(self):
+        class ValueResolver(IterableResolver, register=False):
+            @classmethod
+            def can_handle(cls, resolvable):
+                return isinstance(resolvable, list) and len(resolvable) > 1
+
+        assert IterableResolver.type_dispatched
+        assert not ValueResolver.type_dispatched
@@ -125,3 +125,46 @@ class _(spawn('.main', default_overrides=[{'x':20}])):
                 UnusedOverrides, match=r"Unused spawn default override\(s\) x"
             ):
                 rslvd = load_solconf(root / "fails.solconf")
+
+
+def test_sub_dir(tmp_path):
+    root = tmp_path / "runs"
+    assert mdl.sub_dir(root, create=False) == str(root / "1")
+    assert mdl.sub_dir(root) == str(root / "1")
+    assert mdl.sub_dir(root) == str(root / "2")
+    # Non-integer and non-directory entries are ignored
+    (root / "abc").mkdir()
+    (root / "-5").mkdir()
+    (root / "\u0661\u0662").mkdir()  # Arabic-Indic digits for 12
+    (root / "10").touch()
+    assert mdl.sub_dir(root) == str(root / "3")
+    assert sorted(x.name for x in root.iterdir()) == [
+        "-5",
+        "1",
+        "10",
+        "2",
+        "3",
+        "abc",
+        "\u0661\u0662",
+    ]
+
+
+def test_id_str_computed_once():
+    with solconf_package(
+        {
+            "main": """
+from soleil.solconf import *
+from soleil.utils import id_str
+
+id = id_str()
+path = "out/" + id
+"""
+        }
+    ) as root:
+        module = load_solconf(root / "main.solconf", resolve=False)
+        id_ = module.id
+        calls = []
+        compute_resolved = id_.compute_resolved
+        id_.compute_resolved = lambda: calls.append(1) or compute_resolved()
+        assert resolve(module) == {"id": "main", "path": "out/main"}
+        assert len(calls) == 1